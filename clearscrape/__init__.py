@@ -17,11 +17,13 @@ from .exceptions import (
     RateLimitError,
     AuthenticationError,
     TimeoutError,
+    CircuitOpenError,
 )
 from .types import (
     ScrapeOptions,
     ScrapeResponse,
     ProxyConfig,
+    VALID_DOMAINS,
 )
 
 __version__ = "1.0.0"
@@ -32,7 +34,9 @@ __all__ = [
     "RateLimitError",
     "AuthenticationError",
     "TimeoutError",
+    "CircuitOpenError",
     "ScrapeOptions",
     "ScrapeResponse",
     "ProxyConfig",
+    "VALID_DOMAINS",
 ]
@@ -1,8 +1,42 @@
-"""Main ClearScrape client implementation."""
+"""Main ClearScrape client implementation.
 
+For high-concurrency use of AsyncClearScrape (e.g. large ``scrape_many``
+batches), running on uvloop is roughly twice as fast as the default asyncio
+event loop::
+
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+A custom ``httpx.AsyncBaseTransport`` can also be supplied via the
+``transport`` argument.
+"""
+
+import asyncio
+import binascii
+import functools
+import math
+import random
+import threading
 import time
-from typing import Optional, Dict, Any, TypeVar, Type
-from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from urllib.parse import quote
 
 import httpx
 
@@ -12,14 +46,403 @@ from .exceptions import (
     InsufficientCreditsError,
     RateLimitError,
     TimeoutError,
+    CircuitOpenError,
+)
+from .types import (
+    ScrapeOptions,
+    ScrapeResponse,
+    ProxyConfig,
+    DomainType,
+    WireFormat,
+    VALID_DOMAINS,
 )
-from .types import ScrapeOptions, ScrapeResponse, ProxyConfig, DomainType
+
+_json_dumps: Callable[[Any], bytes]
+_json_loads: Callable[[bytes], Any]
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    _json_dumps = _stdlib_json_dumps
+    _json_loads = json.loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 T = TypeVar("T")
 
 DEFAULT_BASE_URL = "https://clearscrape.io/api"
 DEFAULT_TIMEOUT = 60.0
 DEFAULT_RETRIES = 3
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD = 5
+DEFAULT_CIRCUIT_BREAKER_COOLDOWN = 30.0
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+BACKOFF_JITTER = 0.5
+RETRY_AFTER_JITTER = 0.1
+RATE_LIMIT_DELAY = 5
+DEFAULT_METHOD = "GET"
+WIRE_CONTENT_TYPES = {
+    "json": "application/json",
+    "msgpack": "application/msgpack",
+}
+# Streaming always uses JSON, whatever the client's wire format
+STREAM_HEADERS = {
+    "Content-Type": WIRE_CONTENT_TYPES["json"],
+    "Accept": WIRE_CONTENT_TYPES["json"],
+}
+# Top-level response fields yielded by scrape_iter() alongside the data fields
+STREAM_TOP_FIELDS = ("success", "metadata")
+BROWSER_WS_URL = "wss://browser.clearscrape.io"
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=100,
+    keepalive_expiry=60.0,
+)
+
+# Process-wide connection pools, keyed by client kind and pool settings
+_SHARED_CLIENTS: Dict[Tuple[Any, ...], httpx.Client] = {}
+_SHARED_ASYNC_CLIENTS: Dict[Tuple[Any, ...], httpx.AsyncClient] = {}
+_SHARED_REFCOUNTS: Dict[Tuple[Any, ...], int] = {}
+_SHARED_LOCK = threading.Lock()
+
+# Scrape options forwarded to the API when set to a truthy value
+_PAYLOAD_FIELDS = (
+    "method",
+    "js_render",
+    "premium_proxy",
+    "stealth_proxy",
+    "antibot",
+    "antibot_advanced",
+    "proxy_country",
+    "proxy_city",
+    "proxy_state",
+    "proxy_zip",
+    "wait_for",
+    "wait",
+    "auto_scroll",
+    "scroll_count",
+    "screenshot",
+    "screenshot_fullpage",
+    "screenshot_selector",
+    "headers",
+    "body",
+    "domain",
+    "css_extractor",
+    "autoparse",
+    "output",
+    "js_scenario",
+    "block_ads",
+    "block_resources",
+    "device",
+    "ai_extract",
+    "session_id",
+    "callback_url",
+)
+
+
+def _pool_key(
+    kind: str,
+    base_url: str,
+    timeout: float,
+    http2: bool,
+    limits: httpx.Limits,
+) -> Tuple[Any, ...]:
+    """Return the key identifying a shareable connection pool."""
+    return (
+        kind,
+        base_url,
+        timeout,
+        http2,
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+    )
+
+
+def _acquire_shared(
+    pool: Dict[Tuple[Any, ...], T],
+    key: Tuple[Any, ...],
+    factory: Callable[[], T],
+) -> T:
+    """Get (or create) a shared HTTP client and take a reference to it."""
+    with _SHARED_LOCK:
+        client = pool.get(key)
+        if client is None or client.is_closed:  # type: ignore[attr-defined]
+            client = pool[key] = factory()
+            _SHARED_REFCOUNTS[key] = 0
+        _SHARED_REFCOUNTS[key] += 1
+        return client
+
+
+def _cookieless_jar() -> CookieJar:
+    """Return a cookie jar that never stores cookies.
+
+    Shared pools serve clients with different API keys, so a cookie set in
+    response to one key's request must not be replayed on another's.
+    """
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _closed_client() -> httpx.Client:
+    """Return an already-closed client to stand in for a released pool."""
+    client = httpx.Client(transport=httpx.BaseTransport(), trust_env=False)
+    client.close()
+    return client
+
+
+async def _closed_async_client() -> httpx.AsyncClient:
+    """Async version of _closed_client()."""
+    client = httpx.AsyncClient(transport=httpx.AsyncBaseTransport(), trust_env=False)
+    await client.aclose()
+    return client
+
+
+def _release_shared(
+    pool: Dict[Tuple[Any, ...], T],
+    key: Tuple[Any, ...],
+) -> Optional[T]:
+    """Drop a reference to a shared client; return it if it should be closed."""
+    with _SHARED_LOCK:
+        _SHARED_REFCOUNTS[key] -= 1
+        if _SHARED_REFCOUNTS[key] > 0:
+            return None
+        del _SHARED_REFCOUNTS[key]
+        return pool.pop(key)
+
+
+def _build_payload(url: str, **options: Any) -> Dict[str, Any]:
+    """Build a /scrape request body, omitting unset and default options."""
+    payload: Dict[str, Any] = {"url": url}
+    for name in _PAYLOAD_FIELDS:
+        value = options.get(name)
+        if value and not (name == "method" and value == DEFAULT_METHOD):
+            payload[name] = value
+    return payload
+
+
+def _check_domain(domain: Optional[str]) -> None:
+    """Reject an unknown domain extractor before any request is sent."""
+    if domain and domain not in VALID_DOMAINS:
+        raise ValueError(f"Unsupported domain extractor: {domain!r}")
+
+
+def _check_options(options: Dict[str, Any]) -> None:
+    """Validate scrape options passed through ``**kwargs``."""
+    unknown = options.keys() - set(_PAYLOAD_FIELDS)
+    if unknown:
+        raise TypeError(f"Unexpected scrape option(s): {', '.join(sorted(unknown))}")
+    _check_domain(options.get("domain"))
+
+
+def _build_stream_payload(url: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate scrape_iter() options and build the /scrape request body."""
+    if ijson is None:
+        raise ImportError(
+            "scrape_iter() requires the ijson package: "
+            'pip install "clearscrape[stream]"'
+        )
+    _check_options(options)
+    return _build_payload(url, **options)
+
+
+class _FieldStream:
+    """Incremental parser for a streamed /scrape response body.
+
+    Emits each field of the ``data`` object, plus the top-level ``success``
+    and ``metadata`` values, as ``(field, value)`` pairs as soon as the
+    value has been fully parsed.
+    """
+
+    def __init__(self) -> None:
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        self._field = ""
+        self._builder: Any = None
+        self._depth = 0
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, Any]]:
+        try:
+            self._parser.send(chunk)
+        except ijson.JSONError as e:
+            raise ClearScrapeError(f"Malformed streaming response: {e}") from e
+        return self._drain()
+
+    def close(self) -> List[Tuple[str, Any]]:
+        try:
+            self._parser.close()
+        except ijson.JSONError as e:
+            raise ClearScrapeError(f"Malformed streaming response: {e}") from e
+        return self._drain()
+
+    def _drain(self) -> List[Tuple[str, Any]]:
+        fields: List[Tuple[str, Any]] = []
+        for prefix, event, value in self._events:
+            if self._builder is None:
+                if event == "map_key" and (
+                    prefix == "data" or (prefix == "" and value in STREAM_TOP_FIELDS)
+                ):
+                    self._field = value
+                    self._builder = ijson.ObjectBuilder()
+                continue
+
+            self._builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                self._depth += 1
+            elif event in ("end_map", "end_array"):
+                self._depth -= 1
+            if self._depth == 0:
+                fields.append((self._field, self._builder.value))
+                self._builder = None
+        del self._events[:]
+        return fields
+
+
+def _decode_response(response: httpx.Response) -> Any:
+    """Decode a response body according to its Content-Type."""
+    content_type = response.headers.get("Content-Type", "")
+    if msgpack is not None and "msgpack" in content_type:
+        return msgpack.unpackb(response.content, raw=False)
+    return _json_loads(response.content)
+
+
+def _decode_error_body(response: httpx.Response) -> Dict[str, Any]:
+    """Decode an error response, falling back to its text for non-API bodies."""
+    try:
+        data = _decode_response(response)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        return data
+    if response.status_code >= 500:
+        # Gateway error pages are HTML; the status line is the useful part
+        return {"message": f"{response.status_code} {response.reason_phrase}"}
+    return {"message": response.text}
+
+
+def _decode_screenshot(screenshot: str) -> bytes:
+    """Decode a base64 screenshot, skipping any data URL prefix."""
+    start = screenshot.index(",") + 1 if screenshot.startswith("data:") else 0
+    return binascii.a2b_base64(screenshot[start:])
+
+
+def _compute_backoff(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Return a jittered backoff delay for a retry attempt.
+
+    A server-advertised ``retry_after`` is honored with a small upward-only
+    jitter, so the wait never undershoots it; otherwise the delay grows
+    exponentially with the attempt number.
+    """
+    if retry_after is not None:
+        return retry_after * (1 + random.uniform(0, RETRY_AFTER_JITTER))
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2.0**attempt)
+    return delay * (1 + random.uniform(-BACKOFF_JITTER, BACKOFF_JITTER))
+
+
+def _parse_retry_after(value: Optional[str]) -> int:
+    """Parse a Retry-After header given in seconds or as an HTTP-date."""
+    if not value:
+        return RATE_LIMIT_DELAY
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return RATE_LIMIT_DELAY
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, math.ceil((retry_at - datetime.now(timezone.utc)).total_seconds()))
+
+
+def _classify_error(
+    http_response: httpx.Response,
+    response: Dict[str, Any],
+) -> Tuple[bool, ClearScrapeError]:
+    """Map an API error response to (retryable, exception)."""
+    status_code = http_response.status_code
+    message = response.get("message") or response.get("error", "Unknown error")
+
+    # Don't retry client errors (except rate limits)
+    if status_code == 401:
+        return False, AuthenticationError(message)
+    if status_code == 402:
+        return False, InsufficientCreditsError(
+            message,
+            required=response.get("required"),
+        )
+    if status_code == 429:
+        return True, RateLimitError(
+            message,
+            retry_after=_parse_retry_after(http_response.headers.get("Retry-After")),
+        )
+    if 400 <= status_code < 500:
+        return False, ClearScrapeError(message, status_code, response)
+
+    # Retry server errors
+    return True, ClearScrapeError(message, status_code, response)
+
+
+class _AdaptiveLimiter:
+    """AIMD concurrency limit for async batches.
+
+    Every HTTP attempt holds a slot. The limit grows by ``1 / limit`` per
+    successful response (about +1 per window of requests) and halves on a
+    429, at most once per window: rate limits on requests that were already
+    in flight when the limit last dropped are ignored. Other outcomes leave
+    the limit unchanged, and it never goes below 1.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._started = 0
+        # Tickets up to this one were in flight at the last decrease
+        self._window_end = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> int:
+        """Wait for a free slot and return a ticket for release()."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            self._started += 1
+            return self._started
+
+    async def release(
+        self,
+        ticket: int,
+        *,
+        success: bool = False,
+        rate_limited: bool = False,
+    ) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            if rate_limited:
+                if ticket > self._window_end:
+                    self.limit = max(1.0, self.limit / 2)
+                    self._window_end = self._started
+            elif success:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._condition.notify_all()
 
 
 class ClearScrape:
@@ -33,6 +456,17 @@ class ClearScrape:
         base_url: Custom API base URL (default: https://api.clearscrape.io)
         timeout: Request timeout in seconds (default: 60)
         retries: Number of retries for failed requests (default: 3)
+        http2: Use HTTP/2 so concurrent requests share one connection
+            (default: True)
+        limits: Connection pool limits (default: 50 keep-alive, 100 total)
+        wire_format: "json" or "msgpack" request/response encoding
+            (default: json; msgpack requires the ``msgpack`` package)
+        share_pool: Reuse one process-wide connection pool across clients
+            with the same settings (default: True)
+        circuit_breaker_threshold: Consecutive failed requests before failing
+            fast with CircuitOpenError; 0 disables the breaker (default: 5)
+        circuit_breaker_cooldown: Seconds to fail fast once the breaker
+            opens (default: 30)
 
     Example:
         >>> from clearscrape import ClearScrape
@@ -64,22 +498,65 @@ class ClearScrape:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         retries: int = DEFAULT_RETRIES,
+        http2: bool = True,
+        limits: Optional[httpx.Limits] = None,
+        wire_format: WireFormat = "json",
+        share_pool: bool = True,
+        circuit_breaker_threshold: int = DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+        circuit_breaker_cooldown: float = DEFAULT_CIRCUIT_BREAKER_COOLDOWN,
     ):
         if not api_key:
             raise ValueError("API key is required")
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError("wire_format must be 'json' or 'msgpack'")
+        if wire_format == "msgpack" and msgpack is None:
+            raise ImportError(
+                "wire_format='msgpack' requires the msgpack package: "
+                'pip install "clearscrape[msgpack]"'
+            )
 
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retries = retries
-
-        self._client = httpx.Client(
+        self.wire_format = wire_format
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_cooldown = circuit_breaker_cooldown
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        # scrape_many() updates the breaker from worker threads
+        self._circuit_lock = threading.Lock()
+        self._browser_ws_url = f"{BROWSER_WS_URL}?apiKey={quote(api_key, safe='')}"
+        self._encode = msgpack.packb if wire_format == "msgpack" else _json_dumps
+        content_type = WIRE_CONTENT_TYPES[wire_format]
+        # Sent per request so clients with different keys can share a pool;
+        # shared pools also never store cookies
+        self._headers = {
+            "X-API-Key": api_key,
+            "Content-Type": content_type,
+            "Accept": content_type,
+        }
+
+        limits = limits or DEFAULT_LIMITS
+        # Without HTTP/2 each in-flight request needs its own connection
+        self._max_connections = None if http2 else limits.max_connections
+        factory = functools.partial(
+            httpx.Client,
+            http2=http2,
             timeout=timeout,
-            headers={
-                "X-API-Key": api_key,
-                "Content-Type": "application/json",
-            },
+            limits=limits,
         )
+        self._shared = share_pool
+        self._pool_key: Optional[Tuple[Any, ...]] = None
+        if share_pool:
+            self._pool_key = _pool_key("sync", self.base_url, timeout, http2, limits)
+            self._client = _acquire_shared(
+                _SHARED_CLIENTS,
+                self._pool_key,
+                functools.partial(factory, cookies=_cookieless_jar()),
+            )
+        else:
+            self._client = factory()
 
     def __enter__(self) -> "ClearScrape":
         return self
@@ -88,14 +565,22 @@ class ClearScrape:
         self.close()
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client, or release it if the pool is shared."""
+        if not self._shared:
+            self._client.close()
+        elif self._pool_key is not None:
+            key, self._pool_key = self._pool_key, None
+            client = _release_shared(_SHARED_CLIENTS, key)
+            if client is not None:
+                client.close()
+            # Other clients may still use the pool; fail like a closed client
+            self._client = _closed_client()
 
     def scrape(
         self,
         url: str,
         *,
-        method: str = "GET",
+        method: str = DEFAULT_METHOD,
         js_render: bool = False,
         premium_proxy: bool = False,
         stealth_proxy: bool = False,
@@ -148,6 +633,9 @@ class ClearScrape:
         Returns:
             ScrapeResponse with HTML content and metadata
 
+        Raises:
+            ValueError: If ``domain`` is not one of VALID_DOMAINS
+
         Example:
             >>> result = client.scrape(
             ...     "https://example.com",
@@ -156,72 +644,162 @@ class ClearScrape:
             ... )
             >>> print(result.html)
         """
-        payload: Dict[str, Any] = {"url": url}
-
-        if method != "GET":
-            payload["method"] = method
-        if js_render:
-            payload["js_render"] = True
-        if premium_proxy:
-            payload["premium_proxy"] = True
-        if stealth_proxy:
-            payload["stealth_proxy"] = True
-        if antibot:
-            payload["antibot"] = True
-        if antibot_advanced:
-            payload["antibot_advanced"] = True
-        if proxy_country:
-            payload["proxy_country"] = proxy_country
-        if proxy_city:
-            payload["proxy_city"] = proxy_city
-        if proxy_state:
-            payload["proxy_state"] = proxy_state
-        if proxy_zip:
-            payload["proxy_zip"] = proxy_zip
-        if wait_for:
-            payload["wait_for"] = wait_for
-        if wait:
-            payload["wait"] = wait
-        if auto_scroll:
-            payload["auto_scroll"] = True
-        if scroll_count:
-            payload["scroll_count"] = scroll_count
-        if screenshot:
-            payload["screenshot"] = True
-        if screenshot_fullpage:
-            payload["screenshot_fullpage"] = True
-        if screenshot_selector:
-            payload["screenshot_selector"] = screenshot_selector
-        if headers:
-            payload["headers"] = headers
-        if body:
-            payload["body"] = body
-        if domain:
-            payload["domain"] = domain
-        if css_extractor:
-            payload["css_extractor"] = css_extractor
-        if autoparse:
-            payload["autoparse"] = True
-        if output:
-            payload["output"] = output
-        if js_scenario:
-            payload["js_scenario"] = js_scenario
-        if block_ads:
-            payload["block_ads"] = True
-        if block_resources:
-            payload["block_resources"] = True
-        if device:
-            payload["device"] = device
-        if ai_extract:
-            payload["ai_extract"] = ai_extract
-        if session_id:
-            payload["session_id"] = session_id
-        if callback_url:
-            payload["callback_url"] = callback_url
+        _check_domain(domain)
+
+        payload = _build_payload(
+            url,
+            method=method,
+            js_render=js_render,
+            premium_proxy=premium_proxy,
+            stealth_proxy=stealth_proxy,
+            antibot=antibot,
+            antibot_advanced=antibot_advanced,
+            proxy_country=proxy_country,
+            proxy_city=proxy_city,
+            proxy_state=proxy_state,
+            proxy_zip=proxy_zip,
+            wait_for=wait_for,
+            wait=wait,
+            auto_scroll=auto_scroll,
+            scroll_count=scroll_count,
+            screenshot=screenshot,
+            screenshot_fullpage=screenshot_fullpage,
+            screenshot_selector=screenshot_selector,
+            headers=headers,
+            body=body,
+            domain=domain,
+            css_extractor=css_extractor,
+            autoparse=autoparse,
+            output=output,
+            js_scenario=js_scenario,
+            block_ads=block_ads,
+            block_resources=block_resources,
+            device=device,
+            ai_extract=ai_extract,
+            session_id=session_id,
+            callback_url=callback_url,
+        )
 
         data = self._make_request("/scrape", payload)
         return ScrapeResponse.from_dict(data)
 
+    def scrape_many(
+        self,
+        urls: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs: Any,
+    ) -> List[Union[ScrapeResponse, BaseException]]:
+        """
+        Scrape multiple URLs concurrently.
+
+        Requests are dispatched from a thread pool and share this client's
+        connection pool; httpx releases the GIL while waiting on sockets, so
+        throughput scales with the number of workers. With ``http2=False``
+        every in-flight request needs its own connection, so workers are
+        capped at the pool's ``max_connections`` (a shared pool may also be
+        busy with other clients' requests). Over HTTP/2 one connection
+        multiplexes many requests and no cap applies. Tune
+        ``max_concurrency`` to your account's rate limit to avoid a burst of
+        429 responses.
+
+        Args:
+            urls: Target URLs to scrape
+            max_concurrency: Maximum number of in-flight requests (default: 10)
+            **kwargs: Additional options passed to scrape()
+
+        Returns:
+            One entry per URL, in input order: a ScrapeResponse on success,
+            or the exception raised for that URL
+
+        Example:
+            >>> results = client.scrape_many(
+            ...     ["https://example.com/a", "https://example.com/b"],
+            ...     max_concurrency=5,
+            ... )
+            >>> for result in results:
+            ...     if isinstance(result, Exception):
+            ...         print("failed:", result)
+            ...     else:
+            ...         print(result.html)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        _check_options(kwargs)
+
+        workers = max_concurrency
+        if self._max_connections is not None:
+            workers = min(workers, self._max_connections)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.scrape, url, **kwargs) for url in urls]
+
+        results: List[Union[ScrapeResponse, BaseException]] = []
+        for future in futures:
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+        return results
+
+    def scrape_iter(self, url: str, **kwargs: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Scrape a URL and stream the response fields as they are parsed.
+
+        Yields ``(field, value)`` pairs from the response's ``data`` object
+        (``html``, ``text``, ``extracted``, ...) while the body is still
+        downloading, so the full JSON document is never buffered. The
+        top-level ``success`` and ``metadata`` (cost, status code, final
+        URL) are yielded too, under those names. Requires the optional
+        ``ijson`` package. Streamed requests are not retried.
+
+        Args:
+            url: Target URL to scrape
+            **kwargs: Scrape options, as accepted by scrape()
+
+        Example:
+            >>> with open("page.html", "w") as f:
+            ...     for field, value in client.scrape_iter("https://example.com"):
+            ...         if field == "html":
+            ...             f.write(value)
+        """
+        # Validate here rather than in the generator so bad options raise
+        # at the call site, not on the first next()
+        return self._stream_fields(_build_stream_payload(url, kwargs))
+
+    def _stream_fields(self, payload: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        self._check_circuit()
+
+        try:
+            with self._client.stream(
+                "POST",
+                f"{self.base_url}/scrape",
+                content=_json_dumps(payload),
+                headers={**self._headers, **STREAM_HEADERS},
+            ) as response:
+                if not response.is_success:
+                    response.read()
+                    retryable, error = _classify_error(
+                        response, _decode_error_body(response)
+                    )
+                    if retryable:
+                        self._record_failure(error)
+                    else:
+                        self._record_success()
+                    raise error
+                self._record_success()
+
+                fields = _FieldStream()
+                for chunk in response.iter_bytes():
+                    yield from fields.feed(chunk)
+                yield from fields.close()
+        except httpx.TimeoutException:
+            timeout_error = TimeoutError()
+            self._record_failure(timeout_error)
+            raise timeout_error
+        except httpx.RequestError as e:
+            request_error = ClearScrapeError(str(e))
+            self._record_failure(request_error)
+            raise request_error
+
     def get_html(
         self,
         url: str,
@@ -281,8 +859,6 @@ class ClearScrape:
             >>> with open("screenshot.png", "wb") as f:
             ...     f.write(screenshot)
         """
-        import base64
-
         result = self.scrape(
             url,
             js_render=True,
@@ -294,12 +870,7 @@ class ClearScrape:
         if not result.screenshot:
             raise ClearScrapeError("Screenshot not returned")
 
-        # Remove data URL prefix if present
-        screenshot_data = result.screenshot
-        if screenshot_data.startswith("data:"):
-            screenshot_data = screenshot_data.split(",", 1)[1]
-
-        return base64.b64decode(screenshot_data)
+        return _decode_screenshot(result.screenshot)
 
     def extract(
         self,
@@ -370,12 +941,12 @@ class ClearScrape:
             ...     proxies=proxy.as_dict()
             ... )
         """
-        username = self.api_key
-
+        parts = [self.api_key]
         if country:
-            username += f"-country-{country}"
+            parts.append(f"-country-{country}")
         if session:
-            username += f"-session-{session}"
+            parts.append(f"-session-{session}")
+        username = "".join(parts)
 
         return ProxyConfig(
             host="proxy.clearscrape.io",
@@ -438,86 +1009,102 @@ class ClearScrape:
             ...     print(page.title())
             ...     browser.close()
         """
-        params = {"apiKey": self.api_key}
-
         if proxy_country:
-            params["proxy_country"] = proxy_country
-
-        return f"wss://browser.clearscrape.io?{urlencode(params)}"
+            return (
+                f"{self._browser_ws_url}"
+                f"&proxy_country={quote(proxy_country, safe='')}"
+            )
+        return self._browser_ws_url
+
+    def _check_circuit(self) -> None:
+        """Fail fast while the circuit breaker is open."""
+        remaining = self._circuit_open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(retry_after=remaining)
+
+    def _record_success(self) -> None:
+        """Reset the breaker's failure count once the API has answered."""
+        with self._circuit_lock:
+            self._consecutive_failures = 0
+
+    def _record_failure(self, error: ClearScrapeError) -> None:
+        """Count a failed request, opening the breaker at the threshold."""
+        if isinstance(error, RateLimitError):
+            # The API is reachable; rate limits are handled by backoff instead
+            self._record_success()
+            return
+        with self._circuit_lock:
+            self._consecutive_failures += 1
+            threshold = self.circuit_breaker_threshold
+            if threshold and self._consecutive_failures >= threshold:
+                self._circuit_open_until = (
+                    time.monotonic() + self.circuit_breaker_cooldown
+                )
 
     def _make_request(
         self,
         endpoint: str,
         payload: Dict[str, Any],
-        attempt: int = 1,
     ) -> Dict[str, Any]:
         """Make an API request with retries."""
+        self._check_circuit()
         url = f"{self.base_url}{endpoint}"
-
-        try:
-            response = self._client.post(url, json=payload)
-            data = response.json()
-
-            if not response.is_success:
-                return self._handle_error(
-                    response.status_code,
-                    data,
-                    payload,
-                    attempt,
-                )
-
-            return data
-
-        except httpx.TimeoutException:
-            if attempt < self.retries:
-                time.sleep(2**attempt)
-                return self._make_request(endpoint, payload, attempt + 1)
-            raise TimeoutError()
-
-        except httpx.RequestError as e:
-            if attempt < self.retries:
-                time.sleep(2**attempt)
-                return self._make_request(endpoint, payload, attempt + 1)
-            raise ClearScrapeError(str(e))
-
-    def _handle_error(
-        self,
-        status_code: int,
-        response: Dict[str, Any],
-        payload: Dict[str, Any],
-        attempt: int,
-    ) -> Dict[str, Any]:
-        """Handle API errors with appropriate exceptions."""
-        message = response.get("message") or response.get("error", "Unknown error")
-
-        # Don't retry client errors (except rate limits)
-        if 400 <= status_code < 500 and status_code != 429:
-            if status_code == 401:
-                raise AuthenticationError(message)
-            if status_code == 402:
-                raise InsufficientCreditsError(
-                    message,
-                    required=response.get("required"),
+        error = ClearScrapeError("Request failed")
+        delay = 0.0
+
+        for attempt in range(max(self.retries, 1)):
+            if attempt:
+                time.sleep(delay)
+
+            try:
+                response = self._client.post(
+                    url,
+                    content=self._encode(payload),
+                    headers=self._headers,
                 )
-            raise ClearScrapeError(message, status_code, response)
-
-        # Retry rate limits and server errors
-        if attempt < self.retries:
-            delay = 5 if status_code == 429 else 2**attempt
-            time.sleep(delay)
-            return self._make_request("/scrape", payload, attempt + 1)
-
-        if status_code == 429:
-            raise RateLimitError(message)
-
-        raise ClearScrapeError(message, status_code, response)
+            except httpx.TimeoutException:
+                error = TimeoutError()
+                delay = _compute_backoff(attempt)
+                continue
+            except httpx.RequestError as e:
+                error = ClearScrapeError(str(e))
+                delay = _compute_backoff(attempt)
+                continue
+
+            if response.is_success:
+                self._record_success()
+                return _decode_response(response)
+
+            retryable, error = _classify_error(
+                response, _decode_error_body(response)
+            )
+            if not retryable:
+                self._record_success()
+                raise error
+            retry_after = (
+                error.retry_after if isinstance(error, RateLimitError) else None
+            )
+            if retry_after is not None and retry_after > BACKOFF_MAX:
+                # Don't block for an excessive server-requested wait
+                break
+            delay = _compute_backoff(attempt, retry_after)
+
+        self._record_failure(error)
+        raise error
 
 
 class AsyncClearScrape:
     """
     Async ClearScrape API Client.
 
-    An async Python client for the ClearScrape web scraping API.
+    An async Python client for the ClearScrape web scraping API. Accepts the
+    same arguments as ClearScrape, except that ``share_pool`` defaults to
+    False: a shared async pool must only be used from a single event loop.
+
+    Args:
+        transport: Custom httpx transport to send requests through. When set,
+            ``http2`` and ``limits`` must be configured on the transport
+            itself, and the connection pool is never shared.
 
     Example:
         >>> import asyncio
@@ -537,22 +1124,63 @@ class AsyncClearScrape:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         retries: int = DEFAULT_RETRIES,
+        http2: bool = True,
+        limits: Optional[httpx.Limits] = None,
+        wire_format: WireFormat = "json",
+        share_pool: bool = False,
+        circuit_breaker_threshold: int = DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+        circuit_breaker_cooldown: float = DEFAULT_CIRCUIT_BREAKER_COOLDOWN,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         if not api_key:
             raise ValueError("API key is required")
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError("wire_format must be 'json' or 'msgpack'")
+        if wire_format == "msgpack" and msgpack is None:
+            raise ImportError(
+                "wire_format='msgpack' requires the msgpack package: "
+                'pip install "clearscrape[msgpack]"'
+            )
 
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retries = retries
-
-        self._client = httpx.AsyncClient(
+        self.wire_format = wire_format
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_cooldown = circuit_breaker_cooldown
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        self._browser_ws_url = f"{BROWSER_WS_URL}?apiKey={quote(api_key, safe='')}"
+        self._encode = msgpack.packb if wire_format == "msgpack" else _json_dumps
+        content_type = WIRE_CONTENT_TYPES[wire_format]
+        # Sent per request so clients with different keys can share a pool;
+        # shared pools also never store cookies
+        self._headers = {
+            "X-API-Key": api_key,
+            "Content-Type": content_type,
+            "Accept": content_type,
+        }
+
+        limits = limits or DEFAULT_LIMITS
+        factory = functools.partial(
+            httpx.AsyncClient,
+            http2=http2,
             timeout=timeout,
-            headers={
-                "X-API-Key": api_key,
-                "Content-Type": "application/json",
-            },
+            limits=limits,
+            transport=transport,
         )
+        self._shared = share_pool and transport is None
+        self._pool_key: Optional[Tuple[Any, ...]] = None
+        if self._shared:
+            self._pool_key = _pool_key("async", self.base_url, timeout, http2, limits)
+            self._client = _acquire_shared(
+                _SHARED_ASYNC_CLIENTS,
+                self._pool_key,
+                functools.partial(factory, cookies=_cookieless_jar()),
+            )
+        else:
+            self._client = factory()
 
     async def __aenter__(self) -> "AsyncClearScrape":
         return self
@@ -561,14 +1189,21 @@ class AsyncClearScrape:
         await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, or release it if the pool is shared."""
+        if not self._shared:
+            await self._client.aclose()
+        elif self._pool_key is not None:
+            key, self._pool_key = self._pool_key, None
+            client = _release_shared(_SHARED_ASYNC_CLIENTS, key)
+            if client is not None:
+                await client.aclose()
+            self._client = await _closed_async_client()
 
     async def scrape(
         self,
         url: str,
         *,
-        method: str = "GET",
+        method: str = DEFAULT_METHOD,
         js_render: bool = False,
         premium_proxy: bool = False,
         stealth_proxy: bool = False,
@@ -600,72 +1235,123 @@ class AsyncClearScrape:
         callback_url: Optional[str] = None,
     ) -> ScrapeResponse:
         """Async version of scrape(). See ClearScrape.scrape() for details."""
-        payload: Dict[str, Any] = {"url": url}
-
-        if method != "GET":
-            payload["method"] = method
-        if js_render:
-            payload["js_render"] = True
-        if premium_proxy:
-            payload["premium_proxy"] = True
-        if stealth_proxy:
-            payload["stealth_proxy"] = True
-        if antibot:
-            payload["antibot"] = True
-        if antibot_advanced:
-            payload["antibot_advanced"] = True
-        if proxy_country:
-            payload["proxy_country"] = proxy_country
-        if proxy_city:
-            payload["proxy_city"] = proxy_city
-        if proxy_state:
-            payload["proxy_state"] = proxy_state
-        if proxy_zip:
-            payload["proxy_zip"] = proxy_zip
-        if wait_for:
-            payload["wait_for"] = wait_for
-        if wait:
-            payload["wait"] = wait
-        if auto_scroll:
-            payload["auto_scroll"] = True
-        if scroll_count:
-            payload["scroll_count"] = scroll_count
-        if screenshot:
-            payload["screenshot"] = True
-        if screenshot_fullpage:
-            payload["screenshot_fullpage"] = True
-        if screenshot_selector:
-            payload["screenshot_selector"] = screenshot_selector
-        if headers:
-            payload["headers"] = headers
-        if body:
-            payload["body"] = body
-        if domain:
-            payload["domain"] = domain
-        if css_extractor:
-            payload["css_extractor"] = css_extractor
-        if autoparse:
-            payload["autoparse"] = True
-        if output:
-            payload["output"] = output
-        if js_scenario:
-            payload["js_scenario"] = js_scenario
-        if block_ads:
-            payload["block_ads"] = True
-        if block_resources:
-            payload["block_resources"] = True
-        if device:
-            payload["device"] = device
-        if ai_extract:
-            payload["ai_extract"] = ai_extract
-        if session_id:
-            payload["session_id"] = session_id
-        if callback_url:
-            payload["callback_url"] = callback_url
+        _check_domain(domain)
+
+        payload = _build_payload(
+            url,
+            method=method,
+            js_render=js_render,
+            premium_proxy=premium_proxy,
+            stealth_proxy=stealth_proxy,
+            antibot=antibot,
+            antibot_advanced=antibot_advanced,
+            proxy_country=proxy_country,
+            proxy_city=proxy_city,
+            proxy_state=proxy_state,
+            proxy_zip=proxy_zip,
+            wait_for=wait_for,
+            wait=wait,
+            auto_scroll=auto_scroll,
+            scroll_count=scroll_count,
+            screenshot=screenshot,
+            screenshot_fullpage=screenshot_fullpage,
+            screenshot_selector=screenshot_selector,
+            headers=headers,
+            body=body,
+            domain=domain,
+            css_extractor=css_extractor,
+            autoparse=autoparse,
+            output=output,
+            js_scenario=js_scenario,
+            block_ads=block_ads,
+            block_resources=block_resources,
+            device=device,
+            ai_extract=ai_extract,
+            session_id=session_id,
+            callback_url=callback_url,
+        )
 
         data = await self._make_request("/scrape", payload)
         return ScrapeResponse.from_dict(data)
 
+    async def scrape_many(
+        self,
+        urls: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs: Any,
+    ) -> List[Union[ScrapeResponse, BaseException]]:
+        """
+        Async version of scrape_many(). See ClearScrape.scrape_many().
+
+        Concurrency adapts to rate limiting: it starts at ``max_concurrency``,
+        halves (at most once per window of in-flight requests) as soon as the
+        API answers 429, and grows back additively with each successful
+        response. Retries go through the same limiter.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        _check_options(kwargs)
+
+        limiter = _AdaptiveLimiter(max_concurrency)
+
+        async def scrape_one(url: str) -> ScrapeResponse:
+            payload = _build_payload(url, **kwargs)
+            data = await self._make_request("/scrape", payload, limiter)
+            return ScrapeResponse.from_dict(data)
+
+        return await asyncio.gather(
+            *(scrape_one(url) for url in urls),
+            return_exceptions=True,
+        )
+
+    def scrape_iter(
+        self,
+        url: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Async version of scrape_iter(). See ClearScrape.scrape_iter()."""
+        return self._stream_fields(_build_stream_payload(url, kwargs))
+
+    async def _stream_fields(
+        self, payload: Dict[str, Any]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        self._check_circuit()
+
+        try:
+            async with self._client.stream(
+                "POST",
+                f"{self.base_url}/scrape",
+                content=_json_dumps(payload),
+                headers={**self._headers, **STREAM_HEADERS},
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    retryable, error = _classify_error(
+                        response, _decode_error_body(response)
+                    )
+                    if retryable:
+                        self._record_failure(error)
+                    else:
+                        self._record_success()
+                    raise error
+                self._record_success()
+
+                fields = _FieldStream()
+                async for chunk in response.aiter_bytes():
+                    for item in fields.feed(chunk):
+                        yield item
+                for item in fields.close():
+                    yield item
+        except httpx.TimeoutException:
+            timeout_error = TimeoutError()
+            self._record_failure(timeout_error)
+            raise timeout_error
+        except httpx.RequestError as e:
+            request_error = ClearScrapeError(str(e))
+            self._record_failure(request_error)
+            raise request_error
+
     async def get_html(self, url: str, **kwargs) -> str:
         """Async version of get_html()."""
         result = await self.scrape(url, **kwargs)
@@ -684,8 +1370,6 @@ class AsyncClearScrape:
         **kwargs,
     ) -> bytes:
         """Async version of screenshot()."""
-        import base64
-
         result = await self.scrape(
             url,
             js_render=True,
@@ -697,11 +1381,7 @@ class AsyncClearScrape:
         if not result.screenshot:
             raise ClearScrapeError("Screenshot not returned")
 
-        screenshot_data = result.screenshot
-        if screenshot_data.startswith("data:"):
-            screenshot_data = screenshot_data.split(",", 1)[1]
-
-        return base64.b64decode(screenshot_data)
+        return _decode_screenshot(result.screenshot)
 
     async def extract(
         self,
@@ -727,12 +1407,12 @@ class AsyncClearScrape:
         session: Optional[str] = None,
     ) -> ProxyConfig:
         """Get proxy configuration. See ClearScrape.get_proxy_config()."""
-        username = self.api_key
-
+        parts = [self.api_key]
         if country:
-            username += f"-country-{country}"
+            parts.append(f"-country-{country}")
         if session:
-            username += f"-session-{session}"
+            parts.append(f"-session-{session}")
+        username = "".join(parts)
 
         return ProxyConfig(
             host="proxy.clearscrape.io",
@@ -757,78 +1437,106 @@ class AsyncClearScrape:
         proxy_country: Optional[str] = None,
     ) -> str:
         """Get browser WebSocket URL. See ClearScrape.get_browser_ws_url()."""
-        params = {"apiKey": self.api_key}
-
         if proxy_country:
-            params["proxy_country"] = proxy_country
-
-        return f"wss://browser.clearscrape.io?{urlencode(params)}"
+            return (
+                f"{self._browser_ws_url}"
+                f"&proxy_country={quote(proxy_country, safe='')}"
+            )
+        return self._browser_ws_url
+
+    def _check_circuit(self) -> None:
+        """Fail fast while the circuit breaker is open."""
+        remaining = self._circuit_open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(retry_after=remaining)
+
+    def _record_success(self) -> None:
+        """Reset the breaker's failure count once the API has answered."""
+        self._consecutive_failures = 0
+
+    def _record_failure(self, error: ClearScrapeError) -> None:
+        """Count a failed request, opening the breaker at the threshold."""
+        if isinstance(error, RateLimitError):
+            # The API is reachable; rate limits are handled by backoff instead
+            self._consecutive_failures = 0
+            return
+        self._consecutive_failures += 1
+        threshold = self.circuit_breaker_threshold
+        if threshold and self._consecutive_failures >= threshold:
+            self._circuit_open_until = time.monotonic() + self.circuit_breaker_cooldown
+
+    async def _post(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        limiter: Optional[_AdaptiveLimiter],
+    ) -> httpx.Response:
+        """Send one request, holding a limiter slot and reporting its outcome."""
+        if limiter is None:
+            return await self._client.post(
+                url,
+                content=self._encode(payload),
+                headers=self._headers,
+            )
+
+        ticket = await limiter.acquire()
+        success = rate_limited = False
+        try:
+            response = await self._client.post(
+                url,
+                content=self._encode(payload),
+                headers=self._headers,
+            )
+            success = response.is_success
+            rate_limited = response.status_code == 429
+            return response
+        finally:
+            await limiter.release(ticket, success=success, rate_limited=rate_limited)
 
     async def _make_request(
         self,
         endpoint: str,
         payload: Dict[str, Any],
-        attempt: int = 1,
+        limiter: Optional[_AdaptiveLimiter] = None,
     ) -> Dict[str, Any]:
         """Make an async API request with retries."""
-        import asyncio
-
+        self._check_circuit()
         url = f"{self.base_url}{endpoint}"
-
-        try:
-            response = await self._client.post(url, json=payload)
-            data = response.json()
-
-            if not response.is_success:
-                return await self._handle_error(
-                    response.status_code,
-                    data,
-                    payload,
-                    attempt,
-                )
-
-            return data
-
-        except httpx.TimeoutException:
-            if attempt < self.retries:
-                await asyncio.sleep(2**attempt)
-                return await self._make_request(endpoint, payload, attempt + 1)
-            raise TimeoutError()
-
-        except httpx.RequestError as e:
-            if attempt < self.retries:
-                await asyncio.sleep(2**attempt)
-                return await self._make_request(endpoint, payload, attempt + 1)
-            raise ClearScrapeError(str(e))
-
-    async def _handle_error(
-        self,
-        status_code: int,
-        response: Dict[str, Any],
-        payload: Dict[str, Any],
-        attempt: int,
-    ) -> Dict[str, Any]:
-        """Handle API errors with appropriate exceptions."""
-        import asyncio
-
-        message = response.get("message") or response.get("error", "Unknown error")
-
-        if 400 <= status_code < 500 and status_code != 429:
-            if status_code == 401:
-                raise AuthenticationError(message)
-            if status_code == 402:
-                raise InsufficientCreditsError(
-                    message,
-                    required=response.get("required"),
-                )
-            raise ClearScrapeError(message, status_code, response)
-
-        if attempt < self.retries:
-            delay = 5 if status_code == 429 else 2**attempt
-            await asyncio.sleep(delay)
-            return await self._make_request("/scrape", payload, attempt + 1)
-
-        if status_code == 429:
-            raise RateLimitError(message)
-
-        raise ClearScrapeError(message, status_code, response)
+        error = ClearScrapeError("Request failed")
+        delay = 0.0
+
+        for attempt in range(max(self.retries, 1)):
+            if attempt:
+                await asyncio.sleep(delay)
+
+            try:
+                response = await self._post(url, payload, limiter)
+            except httpx.TimeoutException:
+                error = TimeoutError()
+                delay = _compute_backoff(attempt)
+                continue
+            except httpx.RequestError as e:
+                error = ClearScrapeError(str(e))
+                delay = _compute_backoff(attempt)
+                continue
+
+            if response.is_success:
+                self._record_success()
+                return _decode_response(response)
+
+            retryable, error = _classify_error(
+                response, _decode_error_body(response)
+            )
+            if not retryable:
+                self._record_success()
+                raise error
+            retry_after = (
+                error.retry_after if isinstance(error, RateLimitError) else None
+            )
+            if retry_after is not None and retry_after > BACKOFF_MAX:
+                # Don't block for an excessive server-requested wait
+                break
+            delay = _compute_backoff(attempt, retry_after)
+
+        self._record_failure(error)
+        raise error
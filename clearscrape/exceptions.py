@@ -54,6 +54,18 @@ class RateLimitError(ClearScrapeError):
         self.retry_after = retry_after
 
 
+class CircuitOpenError(ClearScrapeError):
+    """Raised when requests are short-circuited after repeated failures."""
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker open after repeated failures",
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class TimeoutError(ClearScrapeError):
     """Raised when request times out."""
 
@@ -1,7 +1,10 @@
 """Type definitions for the ClearScrape SDK."""
 
+import functools
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Literal
+from types import MappingProxyType
+from typing import Optional, Dict, Any, FrozenSet, List, Literal, Mapping, get_args
 
 
 DomainType = Literal[
@@ -40,8 +43,19 @@ DomainType = Literal[
     "expedia",
 ]
 
+VALID_DOMAINS: FrozenSet[str] = frozenset(get_args(DomainType))
 
-@dataclass
+
+WireFormat = Literal["json", "msgpack"]
+
+# Drop the per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Read-only stand-in for a missing "data" object in API responses
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(**_SLOTS)
 class ScrapeOptions:
     """Options for scraping requests."""
 
@@ -61,7 +75,7 @@ class ScrapeOptions:
     domain: Optional[DomainType] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrapeResponse:
     """Response from a scraping request."""
 
@@ -82,7 +96,7 @@ class ScrapeResponse:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ScrapeResponse":
         """Create a ScrapeResponse from a dictionary."""
-        response_data = data.get("data", {})
+        response_data = data.get("data") or _EMPTY
         metadata = data.get("metadata", {})
         return cls(
             success=data.get("success", True),
@@ -101,7 +115,12 @@ class ScrapeResponse:
         )
 
 
-@dataclass
+@functools.lru_cache(maxsize=128)
+def _format_proxy_url(username: str, password: str, host: str, port: int) -> str:
+    return f"http://{username}:{password}@{host}:{port}"
+
+
+@dataclass(**_SLOTS)
 class ProxyConfig:
     """Proxy configuration for residential proxy service."""
 
@@ -113,7 +132,8 @@ class ProxyConfig:
     @property
     def url(self) -> str:
         """Get the full proxy URL."""
-        return f"http://{self.username}:{self.password}@{self.host}:{self.port}"
+        # Cached by value, so the config stays a plain mutable dataclass
+        return _format_proxy_url(self.username, self.password, self.host, self.port)
 
     def as_dict(self) -> Dict[str, Any]:
         """Get proxy config as a dictionary for requests library."""
@@ -0,0 +1,197 @@
+"""Tests for retries, the circuit breaker and shared connection pools."""
+
+import httpx
+import pytest
+
+import clearscrape.client as client_module
+from clearscrape import (
+    CircuitOpenError,
+    ClearScrape,
+    ClearScrapeError,
+    RateLimitError,
+)
+
+BASE_URL = "https://api.test"
+SCRAPE_URL = f"{BASE_URL}/scrape"
+OK_BODY = {"success": True, "data": {"html": "<p>ok</p>"}, "metadata": {"cost": 1}}
+
+
+class FakeTime:
+    """Stands in for the time module inside clearscrape.client."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(client_module, "time", fake)
+    return fake
+
+
+def make_client(**kwargs):
+    kwargs.setdefault("share_pool", False)
+    return ClearScrape("test-key", base_url=BASE_URL, **kwargs)
+
+
+def test_rate_limit_without_json_body_is_retried(respx_mock, clock):
+    route = respx_mock.post(SCRAPE_URL).mock(
+        return_value=httpx.Response(429, content=b"", headers={"Retry-After": "2"})
+    )
+    client = make_client(retries=3)
+
+    with pytest.raises(RateLimitError) as excinfo:
+        client.scrape("https://example.com")
+
+    assert excinfo.value.retry_after == 2
+    assert route.call_count == 3
+    assert len(clock.sleeps) == 2
+    assert all(2 <= delay <= 2.2 for delay in clock.sleeps)
+
+
+def test_gateway_error_page_is_retried(respx_mock, clock):
+    route = respx_mock.post(SCRAPE_URL).mock(
+        side_effect=[
+            httpx.Response(502, text="<html>Bad Gateway</html>"),
+            httpx.Response(200, json=OK_BODY),
+        ]
+    )
+    client = make_client(retries=2)
+
+    result = client.scrape("https://example.com")
+
+    assert result.html == "<p>ok</p>"
+    assert route.call_count == 2
+
+
+def test_breaker_opens_after_threshold(respx_mock, clock):
+    route = respx_mock.post(SCRAPE_URL).mock(
+        return_value=httpx.Response(503, text="Service Unavailable")
+    )
+    client = make_client(
+        retries=1, circuit_breaker_threshold=2, circuit_breaker_cooldown=30.0
+    )
+
+    for _ in range(2):
+        with pytest.raises(ClearScrapeError) as excinfo:
+            client.scrape("https://example.com")
+        assert excinfo.value.status_code == 503
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        client.scrape("https://example.com")
+    assert excinfo.value.retry_after == 30.0
+    assert route.call_count == 2
+
+
+def test_breaker_stays_open_through_cooldown(respx_mock, clock):
+    route = respx_mock.post(SCRAPE_URL).mock(
+        side_effect=[
+            httpx.Response(503, text="Service Unavailable"),
+            httpx.Response(200, json=OK_BODY),
+        ]
+    )
+    client = make_client(
+        retries=1, circuit_breaker_threshold=1, circuit_breaker_cooldown=30.0
+    )
+
+    with pytest.raises(ClearScrapeError):
+        client.scrape("https://example.com")
+
+    clock.now += 29.0
+    with pytest.raises(CircuitOpenError):
+        client.scrape("https://example.com")
+    assert route.call_count == 1
+
+    clock.now += 1.0
+    assert client.scrape("https://example.com").success
+    assert route.call_count == 2
+
+
+def test_success_resets_breaker(respx_mock, clock):
+    failure = httpx.Response(503, text="Service Unavailable")
+    route = respx_mock.post(SCRAPE_URL).mock(
+        side_effect=[failure, httpx.Response(200, json=OK_BODY), failure, failure]
+    )
+    client = make_client(retries=1, circuit_breaker_threshold=2)
+
+    with pytest.raises(ClearScrapeError):
+        client.scrape("https://example.com")
+    client.scrape("https://example.com")
+    with pytest.raises(ClearScrapeError) as excinfo:
+        client.scrape("https://example.com")
+    assert not isinstance(excinfo.value, CircuitOpenError)
+
+    # Two consecutive failures since the success: now it opens
+    with pytest.raises(ClearScrapeError):
+        client.scrape("https://example.com")
+    with pytest.raises(CircuitOpenError):
+        client.scrape("https://example.com")
+    assert route.call_count == 4
+
+
+def test_rate_limits_do_not_open_breaker(respx_mock, clock):
+    respx_mock.post(SCRAPE_URL).mock(
+        return_value=httpx.Response(429, json={"message": "slow down"})
+    )
+    client = make_client(retries=1, circuit_breaker_threshold=1)
+
+    for _ in range(3):
+        with pytest.raises(RateLimitError):
+            client.scrape("https://example.com")
+
+
+def test_shared_pool_is_released_by_refcount():
+    key = client_module._pool_key(
+        "sync", BASE_URL, 12.5, True, client_module.DEFAULT_LIMITS
+    )
+    first = ClearScrape("key-a", base_url=BASE_URL, timeout=12.5)
+    second = ClearScrape("key-b", base_url=BASE_URL, timeout=12.5)
+    shared = first._client
+
+    assert second._client is shared
+    assert client_module._SHARED_REFCOUNTS[key] == 2
+
+    first.close()
+    assert not shared.is_closed
+    assert client_module._SHARED_REFCOUNTS[key] == 1
+    assert first._client.is_closed
+
+    # Closing twice must not release the other client's reference
+    first.close()
+    assert client_module._SHARED_REFCOUNTS[key] == 1
+
+    second.close()
+    assert shared.is_closed
+    assert key not in client_module._SHARED_REFCOUNTS
+    assert key not in client_module._SHARED_CLIENTS
+
+
+def test_closed_shared_pool_is_recreated():
+    first = ClearScrape("key-a", base_url=BASE_URL, timeout=7.5)
+    old = first._client
+    first.close()
+
+    second = ClearScrape("key-b", base_url=BASE_URL, timeout=7.5)
+    try:
+        assert second._client is not old
+        assert not second._client.is_closed
+    finally:
+        second.close()
+
+
+def test_different_settings_use_separate_pools():
+    first = ClearScrape("key-a", base_url=BASE_URL, timeout=5.0)
+    second = ClearScrape("key-a", base_url=BASE_URL, timeout=5.0, http2=False)
+    try:
+        assert first._client is not second._client
+    finally:
+        first.close()
+        second.close()
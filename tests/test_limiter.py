@@ -0,0 +1,56 @@
+"""Tests for the AIMD concurrency limiter used by AsyncClearScrape.scrape_many."""
+
+from clearscrape.client import _AdaptiveLimiter
+
+
+async def test_rate_limit_halves_once_per_window():
+    limiter = _AdaptiveLimiter(8)
+    tickets = [await limiter.acquire() for _ in range(4)]
+
+    await limiter.release(tickets[0], rate_limited=True)
+    assert limiter.limit == 4.0
+
+    # Already in flight when the limit dropped: same window, no second cut
+    await limiter.release(tickets[1], rate_limited=True)
+    await limiter.release(tickets[2], rate_limited=True)
+    assert limiter.limit == 4.0
+
+    # A request started after the decrease opens a new window
+    ticket = await limiter.acquire()
+    await limiter.release(ticket, rate_limited=True)
+    assert limiter.limit == 2.0
+
+
+async def test_limit_never_drops_below_one():
+    limiter = _AdaptiveLimiter(1)
+    for _ in range(3):
+        ticket = await limiter.acquire()
+        await limiter.release(ticket, rate_limited=True)
+    assert limiter.limit == 1.0
+
+
+async def test_success_grows_limit_additively():
+    limiter = _AdaptiveLimiter(4)
+    ticket = await limiter.acquire()
+    await limiter.release(ticket, rate_limited=True)
+    assert limiter.limit == 2.0
+
+    ticket = await limiter.acquire()
+    await limiter.release(ticket, success=True)
+    assert limiter.limit == 2.5
+
+    for _ in range(10):
+        ticket = await limiter.acquire()
+        await limiter.release(ticket, success=True)
+    assert limiter.limit == 4.0
+
+
+async def test_other_failures_leave_limit_unchanged():
+    limiter = _AdaptiveLimiter(4)
+    ticket = await limiter.acquire()
+    await limiter.release(ticket, rate_limited=True)
+
+    ticket = await limiter.acquire()
+    await limiter.release(ticket)
+    assert limiter.limit == 2.0
+    assert limiter.in_flight == 0
@@ -0,0 +1,105 @@
+"""Tests for streaming field-by-field parsing with scrape_iter()."""
+
+import json
+
+import httpx
+import pytest
+
+from clearscrape import ClearScrape, ClearScrapeError
+from clearscrape.client import AsyncClearScrape
+
+pytest.importorskip("ijson")
+
+BASE_URL = "https://api.test"
+BODY = json.dumps(
+    {
+        "success": True,
+        "data": {
+            "html": "<html><body>" + "x" * 5000 + "</body></html>",
+            "text": "x" * 5000,
+            "extracted": {"title": "Widget", "price": 9.99, "tags": ["a", "b"]},
+        },
+        "metadata": {"cost": 5, "statusCode": 200, "url": "https://example.com/"},
+    }
+).encode()
+
+
+def chunked(body, size=512):
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, body):
+        self._chunks = chunked(body)
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def make_client(handler):
+    return AsyncClearScrape(
+        "test-key", base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+
+
+async def test_scrape_iter_yields_fields_success_and_metadata():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, stream=ChunkedStream(BODY))
+
+    client = make_client(handler)
+    fields = [item async for item in client.scrape_iter("https://example.com")]
+
+    assert fields == [
+        ("success", True),
+        ("html", "<html><body>" + "x" * 5000 + "</body></html>"),
+        ("text", "x" * 5000),
+        ("extracted", {"title": "Widget", "price": 9.99, "tags": ["a", "b"]}),
+        ("metadata", {"cost": 5, "statusCode": 200, "url": "https://example.com/"}),
+    ]
+    assert len(requests) == 1
+    assert requests[0].headers["Accept"] == "application/json"
+    assert json.loads(requests[0].content)["url"] == "https://example.com"
+
+
+async def test_scrape_iter_validates_options_eagerly():
+    client = make_client(lambda request: httpx.Response(200, content=BODY))
+
+    with pytest.raises(TypeError):
+        client.scrape_iter("https://example.com", not_an_option=True)
+    with pytest.raises(ValueError):
+        client.scrape_iter("https://example.com", domain="not-a-domain")
+
+
+async def test_scrape_iter_raises_api_errors():
+    client = make_client(
+        lambda request: httpx.Response(403, json={"message": "Forbidden"})
+    )
+
+    with pytest.raises(ClearScrapeError) as excinfo:
+        [item async for item in client.scrape_iter("https://example.com")]
+    assert excinfo.value.status_code == 403
+    assert excinfo.value.message == "Forbidden"
+
+
+async def test_scrape_iter_wraps_truncated_body():
+    client = make_client(lambda request: httpx.Response(200, content=BODY[:-40]))
+
+    with pytest.raises(ClearScrapeError, match="Malformed streaming response"):
+        [item async for item in client.scrape_iter("https://example.com")]
+
+
+def test_sync_scrape_iter_matches_async(respx_mock):
+    respx_mock.post(f"{BASE_URL}/scrape").mock(
+        return_value=httpx.Response(200, stream=httpx.ByteStream(BODY))
+    )
+    client = ClearScrape("test-key", base_url=BASE_URL, share_pool=False)
+
+    fields = dict(client.scrape_iter("https://example.com"))
+
+    assert fields["success"] is True
+    assert fields["extracted"]["price"] == 9.99
+    assert fields["metadata"]["cost"] == 5